@@ -22,18 +22,27 @@ Examples:
 """
 
 import argparse
-import json
+import heapq
 import os
-import platform
-import subprocess
 import sys
 from pathlib import Path
 
+# json, subprocess and concurrent.futures are imported by the functions that
+# need them: they cost several milliseconds each, and `run` is invoked from
+# hooks where that startup latency is paid on every call.
+
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
+# Resolved once per process; every command needs at least one of these.
+HOME_DIR = Path.home()
+IS_WINDOWS = sys.platform == "win32"
+PLATFORM_NAME = "Windows" if IS_WINDOWS else os.uname().sysname
+# Default Windows and macOS filesystems match names case-insensitively.
+CASE_INSENSITIVE_FS = IS_WINDOWS or sys.platform == "darwin"
+
 # Files/directories that indicate a directory is a meaningful Claude Code plugin.
 PLUGIN_INDICATORS = (
     "plugin.json",
@@ -44,6 +53,15 @@ PLUGIN_INDICATORS = (
     "README.md",
 )
 
+# Resource entries reported by the list command, with their display labels.
+LIST_RESOURCES = (
+    ("skills", "skills"),
+    ("hooks", "hooks"),
+    ("agents", "agents"),
+    ("commands", "commands"),
+    ("README.md", "readme"),
+)
+
 # Directories that should never be treated as plugins.
 EXCLUDE_NAMES = frozenset({
     ".git",
@@ -62,34 +80,87 @@ EXCLUDE_NAMES = frozenset({
     "build",
 })
 
+# Link creation/removal is syscall-bound and releases the GIL, so a thread
+# pool overlaps the filesystem round-trips.
+MAX_LINK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of children listed per directory by the info command.
+INFO_MAX_CHILDREN = 10
+
+# Per-marketplace directory stamps from the last sync, stored next to plugins/.
+SYNC_CACHE_NAME = ".sync_cache.json"
+
 
 def get_claude_marketplace() -> Path:
-    return Path.home() / ".claude" / "plugins" / "marketplaces"
+    return HOME_DIR / ".claude" / "plugins" / "marketplaces"
 
 
 def get_bridge_plugins_dir() -> Path:
-    return Path.home() / ".gemini" / "antigravity" / "skills" / "claude-bridge" / "plugins"
+    return HOME_DIR / ".gemini" / "antigravity" / "skills" / "claude-bridge" / "plugins"
 
 
 def get_global_workflows_dir() -> Path:
-    return Path.home() / ".gemini" / "antigravity" / "global_workflows"
+    return HOME_DIR / ".gemini" / "antigravity" / "global_workflows"
 
 
-def is_plugin_dir(path: Path) -> bool:
-    """Check if a directory looks like a Claude Code plugin."""
-    if path.name.startswith(".") or path.name in EXCLUDE_NAMES:
-        return False
-    return any((path / indicator).exists() for indicator in PLUGIN_INDICATORS)
+def get_sync_cache_path() -> Path:
+    return get_bridge_plugins_dir().parent / SYNC_CACHE_NAME
 
 
-def create_link(source: Path, dest: Path, is_windows: bool) -> bool:
+def is_excluded_name(name: str) -> bool:
+    """Check if a directory name should never be treated as a plugin."""
+    return name.startswith(".") or name in EXCLUDE_NAMES
+
+
+def fold_name(name: str) -> str:
+    """Normalize a file name for comparison on case-insensitive filesystems."""
+    return name.casefold() if CASE_INSENSITIVE_FS else name
+
+
+def read_entry_names(path) -> frozenset:
+    """Return the (folded) names in a directory with one listing."""
+    with os.scandir(path) as it:
+        return frozenset(fold_name(entry.name) for entry in it)
+
+
+def list_entry_names(path) -> frozenset:
+    """Like read_entry_names, but empty if the directory is unreadable."""
+    try:
+        return read_entry_names(path)
+    except OSError:
+        return frozenset()
+
+
+def has_plugin_indicators(names: frozenset) -> bool:
+    """Check if a directory listing contains any plugin indicator."""
+    return any(fold_name(indicator) in names for indicator in PLUGIN_INDICATORS)
+
+
+def is_dangling_symlink(entry: os.DirEntry) -> bool:
+    """Check if a scandir entry is a symlink whose target does not exist."""
+    return entry.is_symlink() and not os.path.exists(entry.path)
+
+
+def create_junction(source: str, dest: str) -> None:
+    """Create a directory junction on Windows without spawning cmd.exe."""
+    try:
+        from _winapi import CreateJunction
+    except ImportError:
+        # Interpreters without _winapi.CreateJunction fall back to mklink.
+        import subprocess
+        subprocess.run(
+            ["cmd", "/c", "mklink", "/J", dest, source],
+            check=True, capture_output=True,
+        )
+        return
+    CreateJunction(source, dest)
+
+
+def create_link(source: str, dest: str) -> bool:
     """Create a directory link. Junction on Windows, Symlink on Unix."""
     try:
-        if is_windows:
-            subprocess.run(
-                ["cmd", "/c", "mklink", "/J", str(dest), str(source)],
-                check=True, capture_output=True,
-            )
+        if IS_WINDOWS:
+            create_junction(source, dest)
         else:
             os.symlink(source, dest)
         return True
@@ -98,14 +169,12 @@ def create_link(source: Path, dest: Path, is_windows: bool) -> bool:
         return False
 
 
-def create_file_link(source: Path, dest: Path, is_windows: bool) -> bool:
-    """Create a file link. Hard link on Windows (/H), Symbolic link on Unix."""
+def create_file_link(source: str, dest: str) -> bool:
+    """Create a file link. Hard link on Windows, Symbolic link on Unix."""
     try:
-        if is_windows:
-            subprocess.run(
-                ["cmd", "/c", "mklink", "/H", str(dest), str(source)],
-                check=True, capture_output=True,
-            )
+        if IS_WINDOWS:
+            # os.link calls CreateHardLinkW directly.
+            os.link(source, dest)
         else:
             os.symlink(source, dest)
         return True
@@ -114,38 +183,106 @@ def create_file_link(source: Path, dest: Path, is_windows: bool) -> bool:
         return False
 
 
-def remove_link(path: Path, is_windows: bool) -> bool:
+def remove_link(path: str) -> bool:
     """Remove a link safely."""
     try:
-        if is_windows:
-            if path.is_dir():
-                os.rmdir(path)
-            else:
-                os.remove(path)
-        else:
-            if path.is_symlink() or path.is_file():
-                path.unlink()
-            else:
+        try:
+            os.unlink(path)
+        except (IsADirectoryError, PermissionError) as unlink_error:
+            # Plain directories (EISDIR on Linux, EPERM on macOS) and junctions
+            # on Pythons whose os.unlink cannot remove them. rmdir never
+            # deletes a non-empty directory, so link targets stay untouched.
+            try:
                 os.rmdir(path)
+            except NotADirectoryError:
+                # Not a directory after all: report the real unlink failure.
+                raise unlink_error from None
         return True
     except Exception as e:
         print(f"    [!] Failed to remove: {e}")
         return False
 
 
+def dir_stamp(stat_result: os.stat_result) -> list:
+    """Reduce a stat result to the fields that reveal a changed directory listing."""
+    return [stat_result.st_mtime_ns, stat_result.st_ino]
+
+
+def load_sync_cache(path: Path) -> dict:
+    """Load the sync cache, treating a missing or corrupt file as empty."""
+    import json
+    try:
+        with open(path, "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_sync_cache(path: Path, cache: dict) -> None:
+    """Write the sync cache. A failure only costs a full rescan next time."""
+    import json
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"    [!] Failed to write sync cache: {e}")
+
+
+def is_cache_entry_fresh(entry: dict, bridge_plugins: str, global_workflows: str) -> bool:
+    """Check that no scanned directory changed and every bridged link still exists."""
+    try:
+        for path, stamp in entry["dirs"].items():
+            if dir_stamp(os.stat(path)) != stamp:
+                return False
+        for name in entry["plugins"]:
+            os.lstat(os.path.join(bridge_plugins, name))
+        for name in entry["workflows"]:
+            os.lstat(os.path.join(global_workflows, name))
+    except (OSError, KeyError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def first_entries_by_name(entries, limit: int) -> tuple:
+    """Return the first `limit` entries by name and the total count in one pass."""
+    total = 0
+
+    def counted():
+        nonlocal total
+        for entry in entries:
+            total += 1
+            yield entry
+
+    first = heapq.nsmallest(limit, counted(), key=lambda e: e.name)
+    return first, total
+
+
+def run_parallel(func, jobs: list) -> int:
+    """Run func(*job) for every job on a thread pool and count successes."""
+    if not jobs:
+        return 0
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    with ThreadPoolExecutor(max_workers=min(MAX_LINK_WORKERS, len(jobs))) as pool:
+        futures = [pool.submit(func, *job) for job in jobs]
+        return sum(1 for future in as_completed(futures) if future.result())
+
+
 def resolve_plugin(bridge_plugins: Path, name: str) -> Path:
     """Resolve a (possibly partial) plugin name to its directory."""
     exact = bridge_plugins / name
     if exact.exists():
         return exact.resolve()
 
-    candidates = [p for p in bridge_plugins.iterdir() if name in p.name]
+    # Only matching names are kept; no Path is built for the rest.
+    with os.scandir(bridge_plugins) as it:
+        candidates = [e.name for e in it if name in e.name]
     if len(candidates) == 1:
-        return candidates[0].resolve()
+        return (bridge_plugins / candidates[0]).resolve()
     elif len(candidates) > 1:
         print(f"[!] Ambiguous plugin name '{name}'. Matches:", file=sys.stderr)
         for c in candidates:
-            print(f"    - {c.name}", file=sys.stderr)
+            print(f"    - {c}", file=sys.stderr)
         sys.exit(1)
     else:
         print(f"[!] Plugin '{name}' not found.", file=sys.stderr)
@@ -156,15 +293,24 @@ def resolve_plugin(bridge_plugins: Path, name: str) -> Path:
 # Commands
 # ---------------------------------------------------------------------------
 
-def cmd_sync(_args):
+def cmd_sync(args):
     """Sync plugins and workflows from the Claude marketplace."""
     marketplace = get_claude_marketplace()
     bridge_plugins = get_bridge_plugins_dir()
     global_workflows = get_global_workflows_dir()
-    is_windows = platform.system() == "Windows"
+    cache_path = get_sync_cache_path()
+
+    # Per-entry progress can run to hundreds of lines; block-buffer stdout
+    # instead of flushing each one to a terminal.
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    def log(line: str) -> None:
+        if not args.quiet:
+            print(line)
 
     print("[*] Claude-Antigravity Bridge Sync")
-    print(f"    Platform : {platform.system()}")
+    print(f"    Platform : {PLATFORM_NAME}")
     print(f"    Source   : {marketplace}")
     print(f"    Plugins  : {bridge_plugins}")
     print(f"    Workflows: {global_workflows}")
@@ -177,72 +323,153 @@ def cmd_sync(_args):
     bridge_plugins.mkdir(parents=True, exist_ok=True)
     global_workflows.mkdir(parents=True, exist_ok=True)
 
-    valid_plugin_names: list = []
-    valid_workflow_names: list = []
-    
-    plugins_linked = 0
+    valid_plugin_names: set = set()
+    valid_workflow_names: set = set()
+
+    # The scan below runs once per plugin and command file, so it joins plain
+    # strings instead of building Path objects.
+    bridge_plugins_str = str(bridge_plugins)
+    global_workflows_str = str(global_workflows)
+
+    plugin_jobs: list = []
+    workflow_jobs: list = []
     plugins_skipped = 0
-    workflows_linked = 0
     workflows_skipped = 0
 
-    for mp_dir in sorted(marketplace.iterdir()):
-        if not mp_dir.is_dir() or mp_dir.name.startswith("."):
+    old_cache = {} if args.no_cache else load_sync_cache(cache_path)
+    new_cache: dict = {}
+
+    with os.scandir(marketplace) as it:
+        mp_entries = sorted(it, key=lambda e: e.name)
+
+    for mp_entry in mp_entries:
+        if mp_entry.name.startswith(".") or not mp_entry.is_dir():
             continue
 
-        mp_name = mp_dir.name
-        print(f"[*] Marketplace: {mp_name}")
+        mp_dir = Path(mp_entry.path)
+        mp_name = mp_entry.name
+        log(f"[*] Marketplace: {mp_name}")
+
+        cached = old_cache.get(str(mp_dir))
+        if cached and is_cache_entry_fresh(cached, bridge_plugins_str, global_workflows_str):
+            log("    [=] Unchanged since last sync")
+            valid_plugin_names.update(cached["plugins"])
+            valid_workflow_names.update(cached["workflows"])
+            plugins_skipped += len(cached["plugins"])
+            workflows_skipped += len(cached["workflows"])
+            new_cache[str(mp_dir)] = cached
+            continue
+
+        # Stamps are taken before each listing is read so that a change made
+        # mid-scan invalidates the entry on the next run.
+        scanned_dirs = {str(mp_dir): dir_stamp(os.stat(mp_dir))}
+        # Stamps only reveal entries being added or removed. A dangling
+        # symlink or an unreadable directory can become valid without that,
+        # so a marketplace containing one is rescanned every time.
+        cacheable = True
+        mp_plugins: list = []
+        mp_workflows: list = []
 
         plugin_base = mp_dir / "plugins"
         if not plugin_base.is_dir():
             plugin_base = mp_dir
+        scanned_dirs[str(plugin_base)] = dir_stamp(os.stat(plugin_base))
 
-        for plugin_dir in sorted(plugin_base.iterdir()):
-            if not plugin_dir.is_dir():
+        with os.scandir(plugin_base) as it:
+            plugin_entries = sorted(it, key=lambda e: e.name)
+
+        for entry in plugin_entries:
+            # Excluded names are rejected before touching the filesystem.
+            if is_excluded_name(entry.name):
+                continue
+            if not entry.is_dir():
+                if is_dangling_symlink(entry):
+                    cacheable = False
                 continue
-            if not is_plugin_dir(plugin_dir):
+            try:
+                plugin_stamp = dir_stamp(os.stat(entry.path))
+                plugin_names = read_entry_names(entry.path)
+            except OSError:
+                cacheable = False
                 continue
+            scanned_dirs[entry.path] = plugin_stamp
+            if not has_plugin_indicators(plugin_names):
+                continue
+            plugin_dir = entry.path
 
-            bridge_name = f"{mp_name}__{plugin_dir.name}"
-            dest = bridge_plugins / bridge_name
-            valid_plugin_names.append(bridge_name)
+            bridge_name = f"{mp_name}__{entry.name}"
+            dest = f"{bridge_plugins_str}{os.sep}{bridge_name}"
+            valid_plugin_names.add(bridge_name)
+            mp_plugins.append(bridge_name)
 
-            if dest.exists() or (hasattr(dest, "is_symlink") and dest.is_symlink()):
+            if os.path.lexists(dest):
                 plugins_skipped += 1
             else:
-                print(f"    [+] Link Plugin: {plugin_dir.name}")
-                if create_link(plugin_dir, dest, is_windows):
-                    plugins_linked += 1
+                log(f"    [+] Link Plugin: {entry.name}")
+                plugin_jobs.append((plugin_dir, dest))
 
             # --- Sync Workflows (Commands) ---
-            commands_dir = plugin_dir / "commands"
-            if commands_dir.exists() and commands_dir.is_dir():
-                for cmd_file in commands_dir.glob("*.md"):
-                    wf_name = f"cb__{mp_name}__{plugin_dir.name}__{cmd_file.name}"
-                    wf_dest = global_workflows / wf_name
-                    valid_workflow_names.append(wf_name)
-
-                    if wf_dest.exists() or (hasattr(wf_dest, "is_symlink") and wf_dest.is_symlink()):
-                        workflows_skipped += 1
-                    else:
-                        print(f"    [+] Link Workflow: {cmd_file.name} -> {wf_name}")
-                        if create_file_link(cmd_file, wf_dest, is_windows):
-                            workflows_linked += 1
-
-    # Cleanup obsolete plugins
-    plugins_removed = 0
-    for existing in sorted(bridge_plugins.iterdir()):
-        if existing.name not in valid_plugin_names:
-            print(f"    [-] Remove Plugin: {existing.name}")
-            if remove_link(existing, is_windows):
-                plugins_removed += 1
+            commands_dir = f"{plugin_dir}{os.sep}commands"
+            cmd_files = []
+            try:
+                commands_stamp = dir_stamp(os.stat(commands_dir))
+                with os.scandir(commands_dir) as it:
+                    for e in it:
+                        if not e.name.endswith(".md"):
+                            continue
+                        if e.is_file():
+                            cmd_files.append(e)
+                        elif is_dangling_symlink(e):
+                            cacheable = False
+                scanned_dirs[commands_dir] = commands_stamp
+            except NotADirectoryError:
+                pass
+            except OSError:
+                # Nothing to cache against unless commands/ is simply absent.
+                if fold_name("commands") in plugin_names:
+                    cacheable = False
+
+            for cmd_file in cmd_files:
+                wf_name = f"cb__{mp_name}__{entry.name}__{cmd_file.name}"
+                wf_dest = f"{global_workflows_str}{os.sep}{wf_name}"
+                valid_workflow_names.add(wf_name)
+                mp_workflows.append(wf_name)
+
+                if os.path.lexists(wf_dest):
+                    workflows_skipped += 1
+                else:
+                    log(f"    [+] Link Workflow: {cmd_file.name} -> {wf_name}")
+                    workflow_jobs.append((cmd_file.path, wf_dest))
+
+        if cacheable:
+            new_cache[str(mp_dir)] = {
+                "dirs": scanned_dirs,
+                "plugins": mp_plugins,
+                "workflows": mp_workflows,
+            }
+
+    plugins_linked = run_parallel(create_link, plugin_jobs)
+    workflows_linked = run_parallel(create_file_link, workflow_jobs)
+
+    # Cleanup obsolete plugins (order does not matter, so the listing is not sorted)
+    removal_jobs: list = []
+    with os.scandir(bridge_plugins) as it:
+        for existing in it:
+            if existing.name not in valid_plugin_names:
+                log(f"    [-] Remove Plugin: {existing.name}")
+                removal_jobs.append((existing.path,))
+    plugins_removed = run_parallel(remove_link, removal_jobs)
 
     # Cleanup obsolete workflows
-    workflows_removed = 0
-    for existing in sorted(global_workflows.iterdir()):
-        if existing.name.startswith("cb__") and existing.name not in valid_workflow_names:
-            print(f"    [-] Remove Workflow: {existing.name}")
-            if remove_link(existing, is_windows):
-                workflows_removed += 1
+    removal_jobs = []
+    with os.scandir(global_workflows) as it:
+        for existing in it:
+            if existing.name.startswith("cb__") and existing.name not in valid_workflow_names:
+                log(f"    [-] Remove Workflow: {existing.name}")
+                removal_jobs.append((existing.path,))
+    workflows_removed = run_parallel(remove_link, removal_jobs)
+
+    save_sync_cache(cache_path, new_cache)
 
     print()
     print(f"[+] Done.")
@@ -258,7 +485,8 @@ def cmd_list(_args):
         print("[!] No plugins bridged yet. Run 'sync' first.")
         return
 
-    plugins = sorted(p for p in bridge_plugins.iterdir() if p.is_dir())
+    with os.scandir(bridge_plugins) as it:
+        plugins = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
     if not plugins:
         print("[!] No plugins found.")
         return
@@ -266,17 +494,8 @@ def cmd_list(_args):
     print(f"[*] {len(plugins)} bridged plugins:\n")
     for p in plugins:
         # Show what resources are available
-        resources = []
-        if (p / "skills").exists():
-            resources.append("skills")
-        if (p / "hooks").exists():
-            resources.append("hooks")
-        if (p / "agents").exists():
-            resources.append("agents")
-        if (p / "commands").exists():
-            resources.append("commands")
-        if (p / "README.md").exists():
-            resources.append("readme")
+        names = list_entry_names(p.path)
+        resources = [label for name, label in LIST_RESOURCES if fold_name(name) in names]
 
         tag = ", ".join(resources) if resources else "minimal"
         print(f"  {p.name}  [{tag}]")
@@ -292,15 +511,19 @@ def cmd_info(args):
     print()
 
     # Show structure
-    for item in sorted(plugin_root.iterdir()):
+    with os.scandir(plugin_root) as it:
+        items = sorted(it, key=lambda e: e.name)
+
+    for item in items:
         if item.is_dir():
-            children = list(item.iterdir())
-            print(f"  📁 {item.name}/  ({len(children)} items)")
-            for child in sorted(children)[:10]:
+            with os.scandir(item.path) as it:
+                children, total = first_entries_by_name(it, INFO_MAX_CHILDREN)
+            print(f"  📁 {item.name}/  ({total} items)")
+            for child in children:
                 prefix = "📁" if child.is_dir() else "📄"
                 print(f"      {prefix} {child.name}")
-            if len(children) > 10:
-                print(f"      ... and {len(children) - 10} more")
+            if total > INFO_MAX_CHILDREN:
+                print(f"      ... and {total - INFO_MAX_CHILDREN} more")
         else:
             size = item.stat().st_size
             print(f"  📄 {item.name}  ({size:,} bytes)")
@@ -310,8 +533,10 @@ def cmd_info(args):
     if hooks_json.exists():
         print()
         print("  [Hooks]")
+        import json
         try:
-            data = json.loads(hooks_json.read_text(encoding="utf-8"))
+            with open(hooks_json, "rb") as f:
+                data = json.load(f)
             hooks = data.get("hooks", data)
             for event, matchers in hooks.items():
                 if event == "description":
@@ -338,17 +563,16 @@ def cmd_run(args):
         print(f"[!] Script not found: {script_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Build environment
-    env = os.environ.copy()
-    env["CLAUDE_PLUGIN_ROOT"] = str(plugin_root)
-    env["CLAUDE_PROJECT_DIR"] = str(project_dir)
+    # Build environment. The script inherits os.environ directly; no rollback
+    # is needed because this process exits as soon as the script finishes.
+    os.environ["CLAUDE_PLUGIN_ROOT"] = str(plugin_root)
+    os.environ["CLAUDE_PROJECT_DIR"] = str(project_dir)
 
     # Determine executor
     script_ext = script_path.suffix.lower()
-    is_windows = platform.system() == "Windows"
 
     if script_ext in (".sh", ""):
-        if is_windows:
+        if IS_WINDOWS:
             git_bash = Path(os.environ.get("ProgramFiles", r"C:\Program Files")) / "Git" / "bin" / "bash.exe"
             shell = str(git_bash) if git_bash.exists() else "bash"
             cmd = [shell, str(script_path)] + args.extra_args
@@ -366,8 +590,9 @@ def cmd_run(args):
     print(f"[*] Project : {project_dir}")
     print()
 
+    import subprocess
     stdin_data = args.stdin_data.encode() if args.stdin_data else None
-    result = subprocess.run(cmd, env=env, cwd=str(project_dir), input=stdin_data)
+    result = subprocess.run(cmd, cwd=str(project_dir), input=stdin_data)
     sys.exit(result.returncode)
 
 
@@ -409,7 +634,9 @@ def main():
     sub = parser.add_subparsers(dest="command")
 
     # sync
-    sub.add_parser("sync", help="Sync plugins from Claude marketplace")
+    p_sync = sub.add_parser("sync", help="Sync plugins from Claude marketplace")
+    p_sync.add_argument("--no-cache", action="store_true", help="Ignore the sync cache and rescan every marketplace")
+    p_sync.add_argument("--quiet", action="store_true", help="Only print the header, errors and the summary")
 
     # list
     sub.add_parser("list", help="List all bridged plugins")